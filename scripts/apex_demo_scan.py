@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+APEX Demo Source Scanner
+========================
+
+Shared Java/YAML scanning used by simple_demo_analyzer.py and simple_mapping.py
+(debug_yaml_paths.py and the class-to-YAML mapping scripts reuse the directory
+walker). The walk and per-file analysis run once per process via scan(), and
+per-file results persist across processes in .analysis_cache.json.
+"""
+
+import functools
+import json
+import os
+import re
+from operator import itemgetter
+from pathlib import Path
+
+
+# Single alternation covering everything find_demo_classes extracts from a Java
+# source, so each file is scanned once instead of once per pattern. All the
+# patterns are ASCII, so they run on the raw file bytes and only the captured
+# names and paths are decoded.
+_JAVA_SCAN_RE = re.compile(
+    rb'(?P<cls>public class (\w+))'
+    rb'|(?P<pkg>package\s+([\w.]+);)'
+    rb'|(?P<load>loadFromClasspath\s*\(\s*["\']([^"\']+\.yaml?)["\'])'
+    # Quoted YAML paths only count when they look like config file paths
+    # (contain "/", "-config" or "-demo"), so the engine rejects the rest
+    rb'|(?P<ref>["\']([^"\']*(?:/|-config|-demo)[^"\']*\.yaml)["\'])'
+)
+
+# Demo module layout, relative to the APEX root the scripts are run from
+DEMO_ROOT = Path("apex-demo")
+DEMO_SRC_DIR = DEMO_ROOT / "src" / "main" / "java" / "dev" / "mars" / "apex" / "demo"
+DEMO_RESOURCES_DIR = DEMO_ROOT / "src" / "main" / "resources"
+
+# Directories under the demo source tree that never contain demo classes; the
+# walker does not descend into them at all.
+DEMO_SKIP_DIRS = frozenset({"model", "infrastructure", "runners"})
+
+# Test classes and test utilities are not demos
+DEMO_SKIP_FILE_RE = re.compile(r'Test\.java$|/util/TestUtilities\.java$')
+
+
+def walk_files(root, suffix, skip_dirs=frozenset()):
+    """Yield files under root whose names end with suffix, without entering skip_dirs.
+
+    Uses os.scandir so file/directory checks come from the directory listing
+    itself; only symlinks need an extra stat. As with Path.rglob, symlinked
+    files are yielded but symlinked directories are not entered, and files
+    come out in the same depth-first order.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        subdirs = []
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Missing or unreadable directories are skipped, as with rglob
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip_dirs:
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(suffix) and entry.is_file():
+                    yield Path(entry.path)
+        stack.extend(reversed(subdirs))
+
+
+# Per-file results are cached next to this script, keyed by absolute path and
+# invalidated whenever the file's mtime or size changes.
+ANALYSIS_CACHE_FILE = Path(__file__).resolve().parent / ".analysis_cache.json"
+ANALYSIS_CACHE_VERSION = 4
+
+
+def load_analysis_cache(cache_file=ANALYSIS_CACHE_FILE):
+    """Load the per-file analysis cache, returning an empty cache if it is missing or stale."""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != ANALYSIS_CACHE_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+def save_analysis_cache(cache, cache_file=ANALYSIS_CACHE_FILE, quiet=False):
+    """Persist the per-file analysis cache."""
+    try:
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump({"version": ANALYSIS_CACHE_VERSION, "files": cache}, f)
+    except OSError as e:
+        if not quiet:
+            print(f"⚠️  Could not write analysis cache {cache_file}: {e}")
+
+
+class AnalysisCache:
+    """Cached per-file results for one scan, tracking which entries the scan used."""
+
+    def __init__(self, files):
+        self.files = files
+        self.visited = set()
+        self.changed = False
+
+    def prune(self, roots):
+        """Drop entries under roots that this scan did not visit. Returns True if any were dropped."""
+        prefixes = tuple(os.path.join(os.path.abspath(root), '') for root in roots)
+        stale = [key for key in self.files if key not in self.visited and key.startswith(prefixes)]
+        for key in stale:
+            del self.files[key]
+        return bool(stale)
+
+
+def _cached_analysis(cache, file_path, analyze):
+    """Return analyze(stat) for file_path, reusing the cached result if the file is unchanged."""
+    st = file_path.stat()
+    if cache is None:
+        return analyze(st)
+
+    key = os.path.abspath(file_path)
+    cache.visited.add(key)
+    entry = cache.files.get(key)
+    if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+        return entry["result"]
+
+    result = analyze(st)
+    cache.files[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "result": result}
+    cache.changed = True
+    return result
+
+
+def analyze_java_file(java_file, demo_src_dir):
+    """Analyze a single demo Java class. Returns None if the file has no public class."""
+    content = java_file.read_bytes()
+
+    # Extract class name, package and YAML file references in one pass
+    class_name = None
+    package = None
+    yaml_files_set = set()
+    classpath_yaml_files = set()
+    add_yaml_file = yaml_files_set.add
+
+    for match in _JAVA_SCAN_RE.finditer(content):
+        kind = match.lastgroup
+        if kind == "load":
+            # loadFromClasspath calls
+            yaml_path = match.group(6).decode('utf-8', errors='ignore')
+            if not yaml_path.endswith('.yaml'):
+                yaml_path += '.yaml'
+            add_yaml_file(yaml_path)
+            classpath_yaml_files.add(yaml_path)
+        elif kind == "ref":
+            # Direct config file references in strings
+            add_yaml_file(match.group(8).decode('utf-8', errors='ignore'))
+        elif kind == "cls":
+            if class_name is None:
+                class_name = match.group(2).decode('ascii')
+        elif package is None:
+            package = match.group(4).decode('ascii')
+
+    if class_name is None:
+        return None
+
+    if package is None:
+        package = "unknown"
+
+    # Convert back to sorted list
+    yaml_files = sorted(yaml_files_set)
+
+    # Check for error handling
+    has_error_handling = b"try" in content and b"catch" in content
+
+    # Determine loading pattern
+    if b"YamlConfigurationLoader" in content:
+        loading_pattern = "standard_apex_loader"
+    elif b"loadFromClasspath" in content:
+        loading_pattern = "custom_loader"
+    else:
+        loading_pattern = "unknown"
+
+    return {
+        "class_name": class_name,
+        "package": package,
+        "file_path": str(java_file.relative_to(demo_src_dir.parent.parent.parent)),
+        "yaml_files": yaml_files,
+        "classpath_yaml_files": sorted(classpath_yaml_files),
+        "loading_pattern": loading_pattern,
+        "error_handling": has_error_handling
+    }
+
+
+def find_demo_classes(demo_src_dir, cache=None, quiet=False):
+    """Find all demo Java classes. quiet suppresses progress and error messages."""
+    demo_classes = []
+    
+    if not demo_src_dir.exists():
+        if not quiet:
+            print(f"X Demo source directory not found: {demo_src_dir}")
+        return demo_classes
+    
+    if not quiet:
+        print(f"🔍 Scanning for demo classes in: {demo_src_dir}")
+    
+    # Bind hot-loop lookups to locals
+    skip_file = DEMO_SKIP_FILE_RE.search
+    add_demo_class = demo_classes.append
+    
+    for java_file in walk_files(demo_src_dir, ".java", DEMO_SKIP_DIRS):
+        # Skip test files and utilities (model/infrastructure/runners are pruned by the walk)
+        if skip_file(java_file.as_posix()):
+            continue
+            
+        try:
+            demo_class = _cached_analysis(cache, java_file, lambda st: analyze_java_file(java_file, demo_src_dir))
+            if demo_class is not None:
+                add_demo_class(demo_class)
+            
+        except Exception as e:
+            if not quiet:
+                print(f"⚠️  Error analyzing {java_file}: {e}")
+    
+    # Keep results sorted by class name so reports can iterate them directly
+    demo_classes.sort(key=itemgetter("class_name"))
+    return demo_classes
+
+
+def analyze_yaml_file(yaml_file, demo_resources_dir, st):
+    """Analyze a single YAML resource file."""
+    # Normalize path separators to forward slashes for consistency
+    relative_path = str(yaml_file.relative_to(demo_resources_dir)).replace('\\', '/')
+
+    # Basic documentation quality assessment. A file without a leading comment
+    # is "poor" whatever follows, so the body is only read when it has one.
+    doc_quality = "poor"
+    with open(yaml_file, 'rb') as f:
+        if f.read(1) == b'#':
+            content = f.read()
+            doc_quality = "fair"
+            if b"metadata:" in content and b"description:" in content:
+                doc_quality = "good"
+                if b"tags:" in content and b"version:" in content:
+                    doc_quality = "excellent"
+
+    return {
+        "path": relative_path,
+        "size": st.st_size,
+        "documentation_quality": doc_quality,
+        "exists": True
+    }
+
+
+def find_yaml_files(demo_resources_dir, cache=None, quiet=False):
+    """Find all YAML files in resources. quiet suppresses progress and error messages."""
+    yaml_files = []
+    
+    if not demo_resources_dir.exists():
+        if not quiet:
+            print(f"X Demo resources directory not found: {demo_resources_dir}")
+        return yaml_files
+    
+    if not quiet:
+        print(f"📄 Scanning for YAML files in: {demo_resources_dir}")
+    
+    add_yaml_file = yaml_files.append
+    
+    for yaml_file in walk_files(demo_resources_dir, ".yaml"):
+        try:
+            add_yaml_file(_cached_analysis(cache, yaml_file, lambda st: analyze_yaml_file(yaml_file, demo_resources_dir, st)))
+            
+        except Exception as e:
+            if not quiet:
+                print(f"⚠️  Error analyzing YAML file {yaml_file}: {e}")
+    
+    yaml_files.sort(key=itemgetter("path"))
+    return yaml_files
+
+
+@functools.lru_cache(maxsize=None)
+def scan(demo_src_dir, demo_resources_dir=None, quiet=False):
+    """Scan demo classes and YAML resources once per process.
+
+    Returns a (demo_classes, yaml_files) tuple, sorted by class name and path
+    respectively. Files unchanged since the last run are served from the
+    on-disk analysis cache. Without demo_resources_dir only the classes are
+    scanned and yaml_files is empty; quiet suppresses progress and error
+    messages.
+    """
+    cache = AnalysisCache(load_analysis_cache())
+    demo_classes = find_demo_classes(demo_src_dir, cache, quiet)
+    scanned_roots = [demo_src_dir]
+    if demo_resources_dir is not None:
+        yaml_files = find_yaml_files(demo_resources_dir, cache, quiet)
+        scanned_roots.append(demo_resources_dir)
+    else:
+        yaml_files = []
+
+    # Entries under the scanned roots that were not visited belong to deleted
+    # or renamed files; the file is only rewritten when something changed
+    if cache.prune(scanned_roots) or cache.changed:
+        save_analysis_cache(cache.files, quiet=quiet)
+    return demo_classes, yaml_files
@@ -9,13 +9,36 @@ one self-contained demo or example in the apex-demo module.
 
 import os
 import re
+import sys
+import json
+import hashlib
 import yaml
 from pathlib import Path
-from typing import Set, Dict, List, Tuple
-from collections import defaultdict
+from typing import Set, Dict, FrozenSet, List, Optional, Tuple
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+class KeywordLoader(SafeLoader):
+    """Loader that resolves every untagged scalar to a string.
+
+    Only mapping keys are collected, so implicit int/float/bool/timestamp
+    resolution is wasted work; it would also turn keys such as 'on' or 'yes'
+    into booleans that can never match a reference keyword.
+    """
+
+    def resolve(self, kind, value, implicit):
+        if kind is yaml.ScalarNode:
+            return 'tag:yaml.org,2002:str'
+        return super().resolve(kind, value, implicit)
 
 # Keywords to extract from the reference document
-YAML_KEYWORDS = {
+YAML_KEYWORDS = frozenset({
     # Top-level sections
     'metadata', 'rules', 'enrichments', 'calculations', 'dataSources', 'configuration',
     'data', 'scenario', 'bootstrap', 'scenarios', 'rule-chains', 'endpoints', 'queries',
@@ -47,15 +70,43 @@ YAML_KEYWORDS = {
     
     # Monitoring and health
     'monitoring', 'healthCheckLogging', 'defaultConnectionTimeout',
-}
+})
 
 # SpEL expressions and patterns to look for
-SPEL_PATTERNS = {
+SPEL_PATTERNS = frozenset({
     '#data', '#root', '#this', 'T(', '.matches(', '.contains(', '.startsWith(',
     '.endsWith(', '.toUpperCase(', '.toLowerCase(', '.trim(', '.substring(',
     '.length(', '.size(', '.isAfter(', '.isBefore(', '.plusDays(', '.minusYears(',
     '.format(', 'LocalDate.now()', 'Math.max(', 'Math.min(', 'UUID.randomUUID()',
-}
+})
+
+# SpEL patterns paired with their UTF-8 encoding for matching raw file bytes
+SPEL_PATTERNS_BYTES = tuple((pattern, pattern.encode('utf-8')) for pattern in SPEL_PATTERNS)
+
+# Patterns used to pull keywords out of the reference document
+YAML_BLOCK_RE = re.compile(r'```yaml\n(.*?)\n```', re.DOTALL)
+PROPERTY_NAME_RE = re.compile(r'^\s*([a-zA-Z][a-zA-Z0-9_-]*):(?:\s|$)', re.MULTILINE)
+FIELD_MAPPING_RE = re.compile(r'(source-field|target-field):\s*"([^"]+)"')
+
+# Categories used to group missing keywords in the report, in display order
+MISSING_KEYWORD_CATEGORIES = (
+    ("External Data Configuration", frozenset({
+        'dataSources', 'baseUrl', 'host', 'port', 'database', 'endpoints',
+        'queries', 'getUserById', 'getActiveUsers', 'getCurrentRate',
+        'getHistoricalRate', 'keyHeader', 'keyValue', 'sourceType',
+        'defaultConnectionTimeout', 'healthCheckLogging',
+    })),
+    ("Caching Configuration", frozenset({'cache', 'cache-ttl', 'ttlSeconds', 'maxSize'})),
+    ("Processing Configuration", frozenset({
+        'parallel', 'timeout', 'retry-count', 'retry-on-failure',
+        'include-context', 'error-code',
+    })),
+    ("Dataset Configuration", frozenset({'inline', 'external'})),
+    ("Business Logic", frozenset({
+        'bootstrap', 'scenarios', 'counterpartyLEI', 'creditRating',
+        'settlementMethod',
+    })),
+)
 
 def extract_keywords_from_reference() -> Set[str]:
     """Extract all YAML keywords from the APEX_YAML_REFERENCE.md document."""
@@ -70,14 +121,12 @@ def extract_keywords_from_reference() -> Set[str]:
         content = f.read()
     
     # Extract YAML property names from code blocks
-    yaml_blocks = re.findall(r'```yaml\n(.*?)\n```', content, re.DOTALL)
-    for block in yaml_blocks:
+    for block in YAML_BLOCK_RE.findall(content):
         # Find property names (lines that end with :)
-        properties = re.findall(r'^\s*([a-zA-Z][a-zA-Z0-9_-]*):(?:\s|$)', block, re.MULTILINE)
-        keywords.update(properties)
+        keywords.update(PROPERTY_NAME_RE.findall(block))
     
     # Extract field names from field-mappings examples
-    field_mappings = re.findall(r'(source-field|target-field):\s*"([^"]+)"', content)
+    field_mappings = FIELD_MAPPING_RE.findall(content)
     for _, field_name in field_mappings:
         # Extract the property name (last part after dots)
         if '.' in field_name:
@@ -91,42 +140,46 @@ def find_yaml_files(directory: str) -> List[Path]:
     """Find all YAML files in the given directory."""
     yaml_files = []
     for root, dirs, files in os.walk(directory):
-        # Skip target directories
-        if 'target' in root:
-            continue
+        # Prune target directories so the walk never descends into build output
+        dirs[:] = [d for d in dirs if 'target' not in d]
         for file in files:
             if file.endswith(('.yaml', '.yml')):
                 yaml_files.append(Path(root) / file)
     return yaml_files
 
-def analyze_yaml_file(file_path: Path) -> Tuple[Set[str], Set[str]]:
-    """Analyze a YAML file and return found keywords and SpEL patterns."""
+def analyze_yaml_file(file_path: Path, content: Optional[bytes] = None) -> Tuple[Set[str], Set[str]]:
+    """Analyze a YAML file and return found keywords and SpEL patterns.
+
+    content is the file's raw bytes when the caller has already read them.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Read raw bytes in one call; the parser decodes UTF-8 itself
+        if content is None:
+            with open(file_path, 'rb', buffering=0) as f:
+                content = f.read()
         
         # Parse YAML to extract structure
-        yaml_data = yaml.safe_load(content)
+        yaml_data = yaml.load(content, Loader=KeywordLoader)
         
         found_keywords = set()
         found_spel = set()
         
-        # Extract keywords from YAML structure
-        def extract_from_dict(data, path=""):
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    found_keywords.add(key)
-                    extract_from_dict(value, f"{path}.{key}" if path else key)
-            elif isinstance(data, list):
-                for item in data:
-                    extract_from_dict(item, path)
-        
-        if yaml_data:
-            extract_from_dict(yaml_data)
+        # Extract keywords from YAML structure, walking nested mappings and
+        # lists with an explicit stack instead of recursing per node
+        stack = [yaml_data] if yaml_data else []
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                # Explicitly tagged keys such as '!!int 5' still load as other
+                # types; only strings can match a reference keyword
+                found_keywords.update(key for key in node if isinstance(key, str))
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                stack.extend(node)
         
         # Extract SpEL patterns from content
-        for pattern in SPEL_PATTERNS:
-            if pattern in content:
+        for pattern, encoded in SPEL_PATTERNS_BYTES:
+            if encoded in content:
                 found_spel.add(pattern)
         
         return found_keywords, found_spel
@@ -135,6 +188,144 @@ def analyze_yaml_file(file_path: Path) -> Tuple[Set[str], Set[str]]:
         print(f"Error analyzing {file_path}: {e}")
         return set(), set()
 
+# Below this many files, process start-up costs more than parallel parsing saves
+PARALLEL_THRESHOLD = 32
+
+def analyze_yaml_files(yaml_files: List[Path], contents: Optional[List[Optional[bytes]]] = None) -> List[Tuple[Set[str], Set[str]]]:
+    """Analyze YAML files, spreading the parsing across processes for larger trees.
+
+    contents optionally holds each file's already-read bytes (None to read it).
+    """
+    if contents is None:
+        contents = [None] * len(yaml_files)
+    if len(yaml_files) < PARALLEL_THRESHOLD:
+        return [analyze_yaml_file(yaml_file, content) for yaml_file, content in zip(yaml_files, contents)]
+
+    chunksize = max(1, len(yaml_files) // (4 * (os.cpu_count() or 1)))
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(analyze_yaml_file, yaml_files, contents, chunksize=chunksize))
+
+# Analysis results keyed by the SHA-1 of each file's contents
+COVERAGE_CACHE_FILE = Path(__file__).resolve().parent / ".keyword_coverage_cache.json"
+COVERAGE_CACHE_VERSION = 2
+
+def load_coverage_cache() -> Dict[str, List[List[str]]]:
+    """Load the content-hash cache, returning an empty cache if it is missing or stale."""
+    try:
+        with open(COVERAGE_CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != COVERAGE_CACHE_VERSION:
+        return {}
+    return data.get("files", {})
+
+def save_coverage_cache(cache: Dict[str, List[List[str]]]) -> None:
+    """Persist the content-hash cache."""
+    try:
+        with open(COVERAGE_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"version": COVERAGE_CACHE_VERSION, "files": cache}, f)
+    except OSError as e:
+        print(f"Warning: could not write cache {COVERAGE_CACHE_FILE}: {e}")
+
+# In-process results keyed by (path, mtime, size), so repeated runs in one
+# interpreter skip even reading and hashing unchanged files. Each entry keeps
+# the content digest so the disk cache can tell which entries are still in use.
+MEMO_MAX_ENTRIES = 4096
+_analysis_memo: "OrderedDict[Tuple[str, int, int], Tuple[str, FrozenSet[str], FrozenSet[str]]]" = OrderedDict()
+
+def _memo_key(yaml_file: Path) -> Optional[Tuple[str, int, int]]:
+    try:
+        st = yaml_file.stat()
+    except OSError:
+        return None
+    return (os.path.abspath(yaml_file), st.st_mtime_ns, st.st_size)
+
+def _remember(key: Tuple[str, int, int], digest: str, keywords: Set[str], spel: Set[str]) -> None:
+    _analysis_memo[key] = (digest, frozenset(keywords), frozenset(spel))
+    _analysis_memo.move_to_end(key)
+    if len(_analysis_memo) > MEMO_MAX_ENTRIES:
+        _analysis_memo.popitem(last=False)
+
+def analyze_yaml_files_cached(yaml_files: List[Path]) -> List[Tuple[Set[str], Set[str]]]:
+    """Analyze YAML files, parsing only those whose contents are not already cached."""
+    cache = None
+    results = [None] * len(yaml_files)
+    memo_keys = []
+    digests = []
+    misses = []
+    # Bytes read for hashing are kept for the misses so they are parsed without a second read
+    contents = {}
+
+    for index, yaml_file in enumerate(yaml_files):
+        memo_key = _memo_key(yaml_file)
+        memo_keys.append(memo_key)
+        digests.append(None)
+
+        memoized = _analysis_memo.get(memo_key) if memo_key else None
+        if memoized is not None:
+            _analysis_memo.move_to_end(memo_key)
+            digests[index] = memoized[0]
+            results[index] = (set(memoized[1]), set(memoized[2]))
+            continue
+
+        if cache is None:
+            cache = load_coverage_cache()
+        try:
+            content = yaml_file.read_bytes()
+        except OSError:
+            content = None
+        digest = hashlib.sha1(content).hexdigest() if content is not None else None
+        digests[index] = digest
+
+        entry = cache.get(digest) if digest else None
+        if entry is not None:
+            results[index] = (set(entry[0]), set(entry[1]))
+            if memo_key:
+                _remember(memo_key, digest, *results[index])
+        else:
+            misses.append(index)
+            contents[index] = content
+
+    if cache is None:
+        return results
+
+    # Files with identical contents are parsed once and share the result
+    duplicates = defaultdict(list)
+    unique_misses = []
+    for index in misses:
+        digest = digests[index]
+        if digest is None or digest not in duplicates:
+            unique_misses.append(index)
+        if digest is not None:
+            duplicates[digest].append(index)
+
+    analyzed = analyze_yaml_files([yaml_files[i] for i in unique_misses], [contents[i] for i in unique_misses])
+    for index, result in zip(unique_misses, analyzed):
+        keywords, spel = result
+        digest = digests[index]
+        same_contents = duplicates[digest] if digest else [index]
+        for same_index in same_contents:
+            results[same_index] = (set(keywords), set(spel))
+        # Failed files come back empty; leave them out so the error is reported again
+        if digest and (keywords or spel):
+            cache[digest] = [sorted(keywords), sorted(spel)]
+            for same_index in same_contents:
+                if memo_keys[same_index]:
+                    _remember(memo_keys[same_index], digest, keywords, spel)
+
+    # Drop entries for contents no longer present so the cache does not grow
+    # with every version of every file ever analyzed
+    seen = set(digests)
+    stale = [digest for digest in cache if digest not in seen]
+    for digest in stale:
+        del cache[digest]
+
+    if misses or stale:
+        save_coverage_cache(cache)
+    return results
+
 def main():
     print("APEX YAML Keyword Coverage Analysis")
     print("=" * 50)
@@ -155,108 +346,67 @@ def main():
     # Analyze coverage
     covered_keywords = set()
     covered_spel = set()
-    file_coverage = {}
     
-    for yaml_file in yaml_files:
-        keywords, spel = analyze_yaml_file(yaml_file)
+    for keywords, spel in analyze_yaml_files_cached(yaml_files):
         covered_keywords.update(keywords)
         covered_spel.update(spel)
-        file_coverage[yaml_file] = (keywords, spel)
     
     # Calculate coverage statistics
     covered_reference_keywords = reference_keywords & covered_keywords
     missing_keywords = reference_keywords - covered_keywords
     coverage_percentage = (len(covered_reference_keywords) / len(reference_keywords)) * 100
     
-    print(f"\nCOVERAGE ANALYSIS")
-    print("=" * 50)
-    print(f"Total reference keywords: {len(reference_keywords)}")
-    print(f"Covered keywords: {len(covered_reference_keywords)}")
-    print(f"Missing keywords: {len(missing_keywords)}")
-    print(f"Coverage percentage: {coverage_percentage:.1f}%")
+    # Build the report in memory and write it in one go
+    out = []
+    add = out.append
+    add("\nCOVERAGE ANALYSIS\n")
+    add("=" * 50 + "\n")
+    add(f"Total reference keywords: {len(reference_keywords)}\n")
+    add(f"Covered keywords: {len(covered_reference_keywords)}\n")
+    add(f"Missing keywords: {len(missing_keywords)}\n")
+    add(f"Coverage percentage: {coverage_percentage:.1f}%\n")
     
     if missing_keywords:
-        print(f"\nMISSING KEYWORDS ({len(missing_keywords)}):")
-        print("=" * 30)
-        for keyword in sorted(missing_keywords):
-            print(f"  - {keyword}")
+        add(f"\nMISSING KEYWORDS ({len(missing_keywords)}):\n")
+        add("=" * 30 + "\n")
+        out.extend(f"  - {keyword}\n" for keyword in sorted(missing_keywords))
     
-    print(f"\nSPEL PATTERNS COVERED ({len(covered_spel)}):")
-    print("=" * 30)
-    for pattern in sorted(covered_spel):
-        print(f"  ✓ {pattern}")
+    add(f"\nSPEL PATTERNS COVERED ({len(covered_spel)}):\n")
+    add("=" * 30 + "\n")
+    out.extend(f"  ✓ {pattern}\n" for pattern in sorted(covered_spel))
     
     missing_spel = SPEL_PATTERNS - covered_spel
     if missing_spel:
-        print(f"\nMISSING SPEL PATTERNS ({len(missing_spel)}):")
-        print("=" * 30)
-        for pattern in sorted(missing_spel):
-            print(f"  - {pattern}")
+        add(f"\nMISSING SPEL PATTERNS ({len(missing_spel)}):\n")
+        add("=" * 30 + "\n")
+        out.extend(f"  - {pattern}\n" for pattern in sorted(missing_spel))
 
     # Categorize missing keywords by type
-    print(f"\nMISSING KEYWORDS BY CATEGORY:")
-    print("=" * 40)
-
-    external_data_keywords = {'dataSources', 'baseUrl', 'host', 'port', 'database', 'endpoints',
-                             'queries', 'getUserById', 'getActiveUsers', 'getCurrentRate',
-                             'getHistoricalRate', 'keyHeader', 'keyValue', 'sourceType',
-                             'defaultConnectionTimeout', 'healthCheckLogging'}
-
-    cache_keywords = {'cache', 'cache-ttl', 'ttlSeconds', 'maxSize'}
-
-    processing_keywords = {'parallel', 'timeout', 'retry-count', 'retry-on-failure',
-                          'include-context', 'error-code'}
-
-    dataset_keywords = {'inline', 'external'}
-
-    business_keywords = {'bootstrap', 'scenarios', 'counterpartyLEI', 'creditRating',
-                        'settlementMethod'}
-
-    missing_external = missing_keywords & external_data_keywords
-    missing_cache = missing_keywords & cache_keywords
-    missing_processing = missing_keywords & processing_keywords
-    missing_dataset = missing_keywords & dataset_keywords
-    missing_business = missing_keywords & business_keywords
-    missing_other = missing_keywords - external_data_keywords - cache_keywords - processing_keywords - dataset_keywords - business_keywords
-
-    if missing_external:
-        print(f"\nExternal Data Configuration ({len(missing_external)}):")
-        for kw in sorted(missing_external):
-            print(f"  - {kw}")
-
-    if missing_cache:
-        print(f"\nCaching Configuration ({len(missing_cache)}):")
-        for kw in sorted(missing_cache):
-            print(f"  - {kw}")
-
-    if missing_processing:
-        print(f"\nProcessing Configuration ({len(missing_processing)}):")
-        for kw in sorted(missing_processing):
-            print(f"  - {kw}")
-
-    if missing_dataset:
-        print(f"\nDataset Configuration ({len(missing_dataset)}):")
-        for kw in sorted(missing_dataset):
-            print(f"  - {kw}")
-
-    if missing_business:
-        print(f"\nBusiness Logic ({len(missing_business)}):")
-        for kw in sorted(missing_business):
-            print(f"  - {kw}")
-
-    if missing_other:
-        print(f"\nOther ({len(missing_other)}):")
-        for kw in sorted(missing_other):
-            print(f"  - {kw}")
-
-    print(f"\nRECOMMENDATIONS:")
-    print("=" * 20)
-    print("1. Create external-data-config examples demonstrating database and REST API connections")
-    print("2. Add caching configuration examples with TTL and size limits")
-    print("3. Create processing configuration examples with parallel execution and retry logic")
-    print("4. Add inline vs external dataset comparison examples")
-    print("5. Create comprehensive SpEL pattern examples covering all missing patterns")
-    print("6. Add bootstrap and scenario registry examples")
+    add("\nMISSING KEYWORDS BY CATEGORY:\n")
+    add("=" * 40 + "\n")
+
+    remaining = set(missing_keywords)
+    for label, category_keywords in MISSING_KEYWORD_CATEGORIES:
+        missing_in_category = remaining & category_keywords
+        remaining -= missing_in_category
+        if missing_in_category:
+            add(f"\n{label} ({len(missing_in_category)}):\n")
+            out.extend(f"  - {kw}\n" for kw in sorted(missing_in_category))
+
+    if remaining:
+        add(f"\nOther ({len(remaining)}):\n")
+        out.extend(f"  - {kw}\n" for kw in sorted(remaining))
+
+    add("\nRECOMMENDATIONS:\n")
+    add("=" * 20 + "\n")
+    add("1. Create external-data-config examples demonstrating database and REST API connections\n")
+    add("2. Add caching configuration examples with TTL and size limits\n")
+    add("3. Create processing configuration examples with parallel execution and retry logic\n")
+    add("4. Add inline vs external dataset comparison examples\n")
+    add("5. Create comprehensive SpEL pattern examples covering all missing patterns\n")
+    add("6. Add bootstrap and scenario registry examples\n")
+
+    sys.stdout.write("".join(out))
 
 if __name__ == "__main__":
     main()
@@ -7,39 +7,53 @@ A focused script to extract clean class-to-YAML mappings without duplicates.
 """
 
 import re
-from pathlib import Path
+import sys
+
+from apex_demo_scan import DEMO_ROOT, DEMO_SKIP_DIRS, DEMO_SKIP_FILE_RE, DEMO_SRC_DIR, walk_files
+
+
+# Class declarations, loadFromClasspath calls and quoted YAML paths in one
+# alternation, so each Java file is scanned once instead of once per pattern.
+# The patterns are ASCII, so they run on the raw file bytes and only the
+# captured names and paths are decoded.
+JAVA_SCAN_RE = re.compile(
+    rb'(?P<cls>public class (\w+))'
+    rb'|(?P<load>loadFromClasspath\s*\(\s*["\']([^"\']+\.yaml?)["\'])'
+    rb'|(?P<ref>["\']([a-zA-Z0-9/_-]+\.yaml)["\'])'
+)
+
+# Quoted YAML paths only count when they look like a config file path
+CONFIG_PATH_HINT_RE = re.compile(rb'config|demo|validation|enrichment|evaluation')
 
 
 def extract_yaml_files_from_class(java_file_path):
     """Extract YAML files referenced in a Java class file."""
     try:
-        content = java_file_path.read_text(encoding='utf-8', errors='ignore')
-        
-        # Extract class name
-        class_match = re.search(r'public class (\w+)', content)
-        if not class_match:
-            return None, []
-            
-        class_name = class_match.group(1)
+        content = java_file_path.read_bytes()
         
-        # Find YAML file references using multiple patterns
+        class_name = None
         yaml_files = set()
         
-        # Pattern 1: loadFromClasspath calls
-        for match in re.finditer(r'loadFromClasspath\s*\(\s*["\']([^"\']+\.yaml?)["\']', content):
-            yaml_path = match.group(1)
-            if not yaml_path.endswith('.yaml'):
-                yaml_path += '.yaml'
-            yaml_files.add(yaml_path)
-        
-        # Pattern 2: Direct YAML file strings (more selective)
-        for match in re.finditer(r'["\']([a-zA-Z0-9/_-]+\.yaml)["\']', content):
-            yaml_path = match.group(1)
-            # Only include if it looks like a config file path
-            if any(keyword in yaml_path for keyword in ['config', 'demo', 'validation', 'enrichment', 'evaluation']):
+        for match in JAVA_SCAN_RE.finditer(content):
+            kind = match.lastgroup
+            if kind == "load":
+                # loadFromClasspath calls
+                yaml_path = match.group(4).decode('utf-8', errors='ignore')
+                if not yaml_path.endswith('.yaml'):
+                    yaml_path += '.yaml'
                 yaml_files.add(yaml_path)
+            elif kind == "ref":
+                # Direct YAML file strings (more selective)
+                yaml_path = match.group(6)
+                if CONFIG_PATH_HINT_RE.search(yaml_path):
+                    yaml_files.add(yaml_path.decode('ascii'))
+            elif class_name is None:
+                class_name = match.group(2).decode('ascii')
+        
+        if class_name is None:
+            return None, []
         
-        return class_name, sorted(list(yaml_files))
+        return class_name, sorted(yaml_files)
         
     except Exception as e:
         return None, []
@@ -51,9 +65,8 @@ def main():
     print("=" * 70)
     
     # Set up paths
-    apex_root = Path(".")
-    demo_root = apex_root / "apex-demo"
-    demo_src = demo_root / "src" / "main" / "java" / "dev" / "mars" / "apex" / "demo"
+    demo_root = DEMO_ROOT
+    demo_src = DEMO_SRC_DIR
     
     if not demo_root.exists():
         print(f"X Error: apex-demo directory not found at {demo_root}")
@@ -62,9 +75,9 @@ def main():
     # Find all demo classes
     demo_mappings = []
     
-    for java_file in demo_src.rglob("*.java"):
-        # Skip test files, utilities, and models
-        if any(skip in str(java_file) for skip in ["Test.java", "/model/", "/util/TestUtilities.java", "/infrastructure/", "/runners/"]):
+    for java_file in walk_files(demo_src, ".java", DEMO_SKIP_DIRS):
+        # Skip test files and utilities (model/infrastructure/runners are pruned by the walk)
+        if DEMO_SKIP_FILE_RE.search(java_file.as_posix()):
             continue
             
         class_name, yaml_files = extract_yaml_files_from_class(java_file)
@@ -81,22 +94,20 @@ def main():
     
     print(f"Found {len(demo_mappings)} demo classes with YAML files:\n")
     
-    # Print in a clean table format
-    print(f"{'Class Name':<45} | {'YAML Files'}")
-    print("-" * 45 + " | " + "-" * 80)
+    # Build the table in memory and write it in one go
+    out = []
+    add = out.append
+    add(f"{'Class Name':<45} | {'YAML Files'}\n")
+    add("-" * 45 + " | " + "-" * 80 + "\n")
     
     for class_name, yaml_files in demo_mappings:
-        if len(yaml_files) == 1:
-            # Single YAML file
-            print(f"{class_name:<45} | {yaml_files[0]}")
-        else:
-            # Multiple YAML files
-            print(f"{class_name:<45} | {yaml_files[0]}")
-            for yaml_file in yaml_files[1:]:
-                print(f"{'':<45} | {yaml_file}")
-        print()  # Empty line between entries
+        # First YAML file shares the class name's line; any others are indented
+        add(f"{class_name:<45} | {yaml_files[0]}\n")
+        out.extend(f"{'':<45} | {yaml_file}\n" for yaml_file in yaml_files[1:])
+        add("\n")  # Empty line between entries
     
-    print(f"Total: {len(demo_mappings)} demo classes with YAML configurations")
+    add(f"Total: {len(demo_mappings)} demo classes with YAML configurations\n")
+    sys.stdout.write("".join(out))
     
     # Also create a simple CSV output
     csv_file = "class_yaml_mapping.csv"
@@ -6,8 +6,11 @@ Debug YAML Path Matching
 Debug script to see what YAML files are referenced vs found.
 """
 
+import heapq
+import os
 import re
-from pathlib import Path
+
+from apex_demo_scan import DEMO_RESOURCES_DIR, DEMO_SRC_DIR, walk_files
 
 
 def main():
@@ -16,21 +19,25 @@ def main():
     print("=" * 50)
     
     # Set up paths
-    apex_root = Path(".")
-    demo_root = apex_root / "apex-demo"
-    demo_src = demo_root / "src" / "main" / "java" / "dev" / "mars" / "apex" / "demo"
-    demo_resources = demo_root / "src" / "main" / "resources"
+    demo_src = DEMO_SRC_DIR
+    demo_resources = DEMO_RESOURCES_DIR
     
     # Find referenced YAML files from Java code
     print("📋 YAML files referenced in Java code:")
     referenced_files = set()
     
-    for java_file in demo_src.rglob("*.java"):
-        if any(skip in str(java_file) for skip in ["Test.java", "/model/", "/util/TestUtilities.java"]):
+    # model packages are pruned by the walk; test classes are skipped per file
+    for java_file in walk_files(demo_src, ".java", frozenset({"model"})):
+        if any(skip in str(java_file) for skip in ["Test.java", "/util/TestUtilities.java"]):
             continue
             
         try:
-            content = java_file.read_text(encoding='utf-8', errors='ignore')
+            # Only classes that load YAML are reported, so test the raw bytes and
+            # decode just the files that can match
+            raw = java_file.read_bytes()
+            if b'loadFromClasspath' not in raw:
+                continue
+            content = raw.decode('utf-8', errors='ignore')
             class_match = re.search(r'public class (\w+)', content)
             if not class_match:
                 continue
@@ -52,22 +59,27 @@ def main():
         except Exception:
             continue
     
+    # Only the first 10 of each list are shown, so pick them with a bounded
+    # heap instead of sorting every path
     print(f"\nTotal referenced files: {len(referenced_files)}")
     print("First 10 referenced files:")
-    for i, ref_file in enumerate(sorted(referenced_files)[:10]):
+    for i, ref_file in enumerate(heapq.nsmallest(10, referenced_files)):
         print(f"  {i+1}. '{ref_file}'")
     
     # Find actual YAML files
     print(f"\n📁 YAML files found in resources:")
     found_files = set()
     
-    for yaml_file in demo_resources.rglob("*.yaml"):
-        relative_path = str(yaml_file.relative_to(demo_resources)).replace('\\', '/')
+    # Every walked path starts with the resources root, so strip it by length
+    # instead of re-parsing each path with relative_to
+    prefix_length = len(os.path.join(str(demo_resources), ''))
+    for yaml_file in walk_files(demo_resources, ".yaml"):
+        relative_path = str(yaml_file)[prefix_length:].replace('\\', '/')
         found_files.add(relative_path)
     
     print(f"Total found files: {len(found_files)}")
     print("First 10 found files:")
-    for i, found_file in enumerate(sorted(found_files)[:10]):
+    for i, found_file in enumerate(heapq.nsmallest(10, found_files)):
         print(f"  {i+1}. '{found_file}'")
     
     # Compare
@@ -82,12 +94,12 @@ def main():
     
     if missing:
         print(f"\n❌ Missing files (first 10):")
-        for i, missing_file in enumerate(sorted(missing)[:10]):
+        for i, missing_file in enumerate(heapq.nsmallest(10, missing)):
             print(f"  {i+1}. '{missing_file}'")
     
     if matching:
         print(f"\n✅ Matching files (first 10):")
-        for i, matching_file in enumerate(sorted(matching)[:10]):
+        for i, matching_file in enumerate(heapq.nsmallest(10, matching)):
             print(f"  {i+1}. '{matching_file}'")
     
     return 0
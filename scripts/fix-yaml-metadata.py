@@ -6,34 +6,62 @@ Automatically fixes common YAML validation issues in APEX configuration files.
 
 import os
 import re
-import sys
+import shutil
+import stat
+import subprocess
+import tempfile
 import yaml
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+YAML_SUFFIXES = ('.yaml', '.yml')
+
+# Metadata fields written back into the document when the fixer adds them
+REQUIRED_METADATA_FIELDS = ('id', 'name', 'version', 'description', 'type')
+
+# Line-level patterns for the --fast metadata pre-scan
+METADATA_HEADER_RE = re.compile(r'^metadata[ \t]*:[ \t]*(?:#.*)?$', re.MULTILINE)
+METADATA_FIELD_RE = re.compile(r'([ \t]+)([A-Za-z][\w-]*)[ \t]*:(?:[ \t]+(.*))?$')
+
 class ApexYamlFixer:
     """Fixes common YAML validation issues for APEX configurations."""
     
-    VALID_DOCUMENT_TYPES = {
+    VALID_DOCUMENT_TYPES = frozenset({
         'rule-config', 'enrichment', 'dataset', 'scenario',
         'scenario-registry', 'bootstrap', 'rule-chain', 
         'external-data-config', 'pipeline-config'
-    }
+    })
     
     TYPE_REQUIRED_FIELDS = {
-        'rule-config': ['author'],
-        'enrichment': ['author'],
-        'dataset': ['source'],
-        'scenario': ['business-domain', 'owner'],
-        'scenario-registry': ['created-by'],
-        'bootstrap': ['business-domain', 'created-by'],
-        'rule-chain': ['author'],
-        'external-data-config': ['author'],
-        'pipeline-config': ['author']
+        'rule-config': ('author',),
+        'enrichment': ('author',),
+        'dataset': ('source',),
+        'scenario': ('business-domain', 'owner'),
+        'scenario-registry': ('created-by',),
+        'bootstrap': ('business-domain', 'created-by'),
+        'rule-chain': ('author',),
+        'external-data-config': ('author',),
+        'pipeline-config': ('author',)
+    }
+    
+    DEFAULT_FIELD_VALUES = {
+        'author': 'apex.team@company.com',
+        'business-domain': 'General',
+        'owner': 'APEX Team',
+        'created-by': 'APEX System',
+        'source': 'Generated'
     }
     
-    def __init__(self, dry_run: bool = False):
+    def __init__(self, dry_run: bool = False, fast: bool = False):
         self.dry_run = dry_run
+        self.fast = fast
         self.fixes_applied = []
         
     def fix_yaml_file(self, file_path: Path) -> bool:
@@ -52,9 +80,7 @@ class ApexYamlFixer:
                     with open(backup_path, 'w', encoding='utf-8') as f:
                         f.write(original_content)
                     
-                    # Write fixed content
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
+                    self._write_atomically(file_path, content)
                     
                     print(f"✅ Fixed: {file_path}")
                     print(f"   Backup: {backup_path}")
@@ -70,16 +96,41 @@ class ApexYamlFixer:
             print(f"❌ Error processing {file_path}: {e}")
             return False
     
+    def _write_atomically(self, file_path: Path, content: str) -> None:
+        """Write content to a temp file beside the real target and swap it in.
+
+        An interrupted run never leaves a half-written YAML file behind. A
+        symlinked file keeps its link; the file it points to is replaced.
+        """
+        target = os.path.realpath(file_path)
+        temp_file = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(target),
+                                                prefix=os.path.basename(target) + '.',
+                                                suffix='.tmp', delete=False)
+        replaced = False
+        try:
+            with temp_file:
+                temp_file.write(content)
+            shutil.copymode(target, temp_file.name)
+            os.replace(temp_file.name, target)
+            replaced = True
+        finally:
+            if not replaced:
+                os.unlink(temp_file.name)
+    
     def _fix_metadata_section(self, content: str, file_path: Path) -> str:
         """Fix metadata section issues."""
         # Check if metadata section exists
-        if not re.search(r'metadata\s*:', content):
+        if 'metadata' not in content or not re.search(r'metadata\s*:', content):
             print(f"⚠️  No metadata section found in {file_path}")
             return content
         
+        # In fast mode, skip the YAML parse when a line scan shows nothing to add
+        if self.fast and self._metadata_looks_complete(content):
+            return content
+        
         # Parse YAML to work with structure
         try:
-            data = yaml.safe_load(content)
+            data = self._load_top_level(content)
             if not isinstance(data, dict) or 'metadata' not in data:
                 return content
                 
@@ -106,12 +157,11 @@ class ApexYamlFixer:
                     fixes.append(f"Added 'type': {doc_type}")
             
             # Add type-specific required fields
-            if 'type' in metadata and metadata['type'] in self.TYPE_REQUIRED_FIELDS:
-                for required_field in self.TYPE_REQUIRED_FIELDS[metadata['type']]:
-                    if required_field not in metadata:
-                        default_value = self._get_default_value(required_field)
-                        metadata['author'] = default_value
-                        fixes.append(f"Added '{required_field}': {default_value}")
+            for required_field in self.TYPE_REQUIRED_FIELDS.get(metadata.get('type'), ()):
+                if required_field not in metadata:
+                    default_value = self._get_default_value(required_field)
+                    metadata['author'] = default_value
+                    fixes.append(f"Added '{required_field}': {default_value}")
             
             if fixes:
                 self.fixes_applied.extend(fixes)
@@ -124,6 +174,62 @@ class ApexYamlFixer:
             print(f"⚠️  YAML parsing error in {file_path}: {e}")
             return content
     
+    def _metadata_looks_complete(self, content: str) -> bool:
+        """Scan the metadata block line by line and report whether no fix is needed.
+
+        Returns False whenever the block is not plain block-style key/value
+        lines, so anything ambiguous falls back to the full YAML parse.
+        """
+        headers = METADATA_HEADER_RE.findall(content)
+        if len(headers) != 1:
+            return False
+        
+        header = METADATA_HEADER_RE.search(content)
+        fields = {}
+        field_indent = None
+        for line in content[header.end():].split('\n')[1:]:
+            stripped = line.strip()
+            if not stripped or stripped.startswith('#'):
+                continue
+            if not line[0].isspace():
+                break
+            
+            field_match = METADATA_FIELD_RE.match(line)
+            indent = field_match.group(1) if field_match else line[:len(line) - len(line.lstrip())]
+            if field_indent is None:
+                field_indent = indent
+            if len(indent) > len(field_indent):
+                continue
+            if indent != field_indent or not field_match:
+                return False
+            fields[field_match.group(2)] = (field_match.group(3) or '').split(' #', 1)[0].strip()
+        
+        doc_type = fields.get('type', '').strip('\'"')
+        if 'id' not in fields or not doc_type or doc_type[0] in '[{|>&*!':
+            return False
+        return all(required_field in fields for required_field in self.TYPE_REQUIRED_FIELDS.get(doc_type, ()))
+    
+    def _load_top_level(self, content: str) -> Optional[Dict]:
+        """Load the document's top-level keys, building values only for metadata.
+
+        The fixer only needs the metadata mapping plus the names of the other
+        top-level sections, so the document is composed into nodes and every
+        section except metadata is left unconstructed (mapped to None).
+        """
+        loader = SafeLoader(content)
+        try:
+            root = loader.get_single_node()
+            if not isinstance(root, yaml.MappingNode):
+                return None
+            
+            data = {}
+            for key_node, value_node in root.value:
+                key = loader.construct_object(key_node, deep=True)
+                data[key] = loader.construct_object(value_node, deep=True) if key == 'metadata' else None
+            return data
+        finally:
+            loader.dispose()
+    
     def _generate_id_from_filename(self, file_path: Path) -> str:
         """Generate a reasonable ID from filename."""
         # Remove extension and convert to kebab-case
@@ -162,14 +268,7 @@ class ApexYamlFixer:
     
     def _get_default_value(self, field_name: str) -> str:
         """Get default value for a field."""
-        defaults = {
-            'author': 'apex.team@company.com',
-            'business-domain': 'General',
-            'owner': 'APEX Team',
-            'created-by': 'APEX System',
-            'source': 'Generated'
-        }
-        return defaults.get(field_name, 'APEX System')
+        return self.DEFAULT_FIELD_VALUES.get(field_name, 'APEX System')
     
     def _preserve_yaml_structure(self, original_content: str, data: Dict) -> str:
         """Preserve YAML structure and comments while updating data."""
@@ -182,8 +281,9 @@ class ApexYamlFixer:
         in_metadata = False
         metadata_indent = 0
         
-        for line in lines:
-            if re.match(r'^metadata\s*:', line):
+        for line_number, line in enumerate(lines):
+            # Cheap literal prefix test first; the regex only confirms the rare candidates
+            if line.startswith('metadata') and re.match(r'^metadata\s*:', line):
                 in_metadata = True
                 metadata_indent = len(line) - len(line.lstrip())
                 result_lines.append(line)
@@ -192,8 +292,8 @@ class ApexYamlFixer:
                 metadata = data['metadata']
                 current_fields = set()
                 
-                # Scan existing fields
-                for next_line in lines[lines.index(line)+1:]:
+                # Scan existing fields, walking forward from the metadata line in place
+                for next_line in islice(lines, line_number + 1, None):
                     if next_line.strip() == '' or next_line.startswith('#'):
                         continue
                     if not next_line.startswith(' ' * (metadata_indent + 2)):
@@ -203,8 +303,7 @@ class ApexYamlFixer:
                         current_fields.add(field_match.group(1))
                 
                 # Add missing required fields
-                required_fields = ['id', 'name', 'version', 'description', 'type']
-                for field in required_fields:
+                for field in REQUIRED_METADATA_FIELDS:
                     if field not in current_fields and field in metadata:
                         indent = ' ' * (metadata_indent + 2)
                         value = metadata[field]
@@ -221,6 +320,48 @@ class ApexYamlFixer:
         
         return '\n'.join(result_lines)
 
+def find_yaml_files(directory: Path, recursive: bool) -> List[Path]:
+    """Find .yaml/.yml files in one directory walk, never descending into target/."""
+    yaml_files = []
+    for root, dirs, files in os.walk(directory):
+        if recursive:
+            dirs[:] = [d for d in dirs if d != 'target']
+        else:
+            dirs.clear()
+        for file in files:
+            if file.endswith(YAML_SUFFIXES):
+                yaml_files.append(Path(root) / file)
+    return sorted(yaml_files)
+
+def staged_yaml_files() -> List[Path]:
+    """List YAML files staged in git (added, copied, modified or renamed), relative to the current directory."""
+    # git reports paths from the top of the work tree, including those outside
+    # the current directory that the path arguments may still select
+    toplevel = subprocess.run(
+        ['git', 'rev-parse', '--show-toplevel'],
+        capture_output=True, text=True, check=True
+    ).stdout.rstrip('\n')
+    output = subprocess.run(
+        ['git', 'diff', '--cached', '--name-only', '--diff-filter=ACMR', '-z'],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return sorted(
+        Path(os.path.relpath(os.path.join(toplevel, name)))
+        for name in output.split('\0') if name.endswith(YAML_SUFFIXES)
+    )
+
+def select_staged_files(staged: List[Path], paths: List[Path], recursive: bool) -> List[Path]:
+    """Keep the staged files that the given file/directory arguments would have selected."""
+    roots = [path.resolve() for path in paths]
+    selected = []
+    for staged_file in staged:
+        resolved = staged_file.resolve()
+        for root in roots:
+            if resolved == root or resolved.parent == root or (recursive and root in resolved.parents):
+                selected.append(staged_file)
+                break
+    return selected
+
 def main():
     """Main function to run the YAML fixer."""
     import argparse
@@ -229,26 +370,39 @@ def main():
     parser.add_argument('paths', nargs='*', help='YAML files or directories to fix')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be fixed without making changes')
     parser.add_argument('--recursive', '-r', action='store_true', help='Process directories recursively')
+    parser.add_argument('--staged', action='store_true',
+                        help='Only process YAML files staged in git, instead of walking the given paths')
+    parser.add_argument('--fast', action='store_true',
+                        help='Skip the YAML parse for files whose metadata block already has every required field')
     
     args = parser.parse_args()
     
     if not args.paths:
         args.paths = ['.']
     
-    fixer = ApexYamlFixer(dry_run=args.dry_run)
+    fixer = ApexYamlFixer(dry_run=args.dry_run, fast=args.fast)
     
     yaml_files = []
-    for path_str in args.paths:
-        path = Path(path_str)
-        if path.is_file() and path.suffix.lower() in ['.yaml', '.yml']:
-            yaml_files.append(path)
-        elif path.is_dir():
-            if args.recursive:
-                yaml_files.extend(path.rglob('*.yaml'))
-                yaml_files.extend(path.rglob('*.yml'))
-            else:
-                yaml_files.extend(path.glob('*.yaml'))
-                yaml_files.extend(path.glob('*.yml'))
+    if args.staged:
+        # Ask git for the changed files rather than walking every directory
+        try:
+            staged = staged_yaml_files()
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"❌ Could not list staged files: {e}")
+            return
+        yaml_files = select_staged_files(staged, [Path(p) for p in args.paths], args.recursive)
+    else:
+        for path_str in args.paths:
+            path = Path(path_str)
+            # One stat answers both the file and the directory question
+            try:
+                mode = path.stat().st_mode
+            except OSError:
+                continue
+            if stat.S_ISREG(mode) and path.suffix.lower() in YAML_SUFFIXES:
+                yaml_files.append(path)
+            elif stat.S_ISDIR(mode):
+                yaml_files.extend(find_yaml_files(path, args.recursive))
     
     # Filter out target directories
     yaml_files = [f for f in yaml_files if 'target' not in str(f)]
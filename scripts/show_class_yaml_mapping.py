@@ -6,9 +6,10 @@ Simple Class to YAML Mapping Display
 Shows a clean grid of demo classes and their YAML files.
 """
 
-import os
 import re
-from pathlib import Path
+import sys
+
+from apex_demo_scan import DEMO_ROOT, DEMO_SKIP_DIRS, DEMO_SKIP_FILE_RE, DEMO_SRC_DIR, walk_files
 
 
 def find_demo_classes_with_yaml(demo_src_dir):
@@ -19,13 +20,18 @@ def find_demo_classes_with_yaml(demo_src_dir):
         print(f"X Demo source directory not found: {demo_src_dir}")
         return demo_classes
     
-    for java_file in demo_src_dir.rglob("*.java"):
-        # Skip test files, utilities, and models
-        if any(skip in str(java_file) for skip in ["Test.java", "/model/", "/util/TestUtilities.java", "/infrastructure/", "/runners/"]):
+    for java_file in walk_files(demo_src_dir, ".java", DEMO_SKIP_DIRS):
+        # Skip test files and utilities (model/infrastructure/runners are pruned by the walk)
+        if DEMO_SKIP_FILE_RE.search(java_file.as_posix()):
             continue
             
         try:
-            content = java_file.read_text(encoding='utf-8', errors='ignore')
+            # Only classes that load YAML are listed, so test the raw bytes and
+            # decode just the files that can match
+            raw = java_file.read_bytes()
+            if b'loadFromClasspath' not in raw:
+                continue
+            content = raw.decode('utf-8', errors='ignore')
             
             # Extract class name
             class_match = re.search(r'public class (\w+)', content)
@@ -61,9 +67,8 @@ def main():
     print("=" * 80)
     
     # Set up paths
-    apex_root = Path(".")
-    demo_root = apex_root / "apex-demo"
-    demo_src = demo_root / "src" / "main" / "java" / "dev" / "mars" / "apex" / "demo"
+    demo_root = DEMO_ROOT
+    demo_src = DEMO_SRC_DIR
     
     # Check if apex-demo exists
     if not demo_root.exists():
@@ -79,26 +84,28 @@ def main():
     
     print(f"Found {len(demo_classes)} demo classes with YAML files:\n")
     
-    # Print header
-    print(f"{'Class Name':<40} | {'YAML Files'}")
-    print("-" * 40 + " | " + "-" * 50)
+    # Build the table in memory and write it in one go
+    out = []
+    add = out.append
+    add(f"{'Class Name':<40} | {'YAML Files'}\n")
+    add("-" * 40 + " | " + "-" * 50 + "\n")
     
-    # Print each class and its YAML files
+    # Add each class and its YAML files
     for demo_class in sorted(demo_classes, key=lambda x: x["class_name"]):
         class_name = demo_class["class_name"]
         yaml_files = demo_class["yaml_files"]
         
-        # Print first YAML file on same line as class name
+        # First YAML file goes on the same line as the class name
         if yaml_files:
-            print(f"{class_name:<40} | {yaml_files[0]}")
+            add(f"{class_name:<40} | {yaml_files[0]}\n")
             
-            # Print additional YAML files indented
-            for yaml_file in yaml_files[1:]:
-                print(f"{'':<40} | {yaml_file}")
+            # Additional YAML files are indented
+            out.extend(f"{'':<40} | {yaml_file}\n" for yaml_file in yaml_files[1:])
         
-        print()  # Empty line between classes
+        add("\n")  # Empty line between classes
     
-    print(f"\nTotal: {len(demo_classes)} demo classes with YAML configurations")
+    add(f"\nTotal: {len(demo_classes)} demo classes with YAML configurations\n")
+    sys.stdout.write("".join(out))
     return 0
 
 
@@ -11,123 +11,21 @@ Usage:
 """
 
 import os
-import re
 import json
-from pathlib import Path
+from collections import defaultdict
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    # Optional: the stdlib json module is used when orjson is not installed
+    orjson = None
 
-def find_demo_classes(demo_src_dir):
-    """Find all demo Java classes."""
-    demo_classes = []
-    
-    if not demo_src_dir.exists():
-        print(f"X Demo source directory not found: {demo_src_dir}")
-        return demo_classes
-    
-    print(f"🔍 Scanning for demo classes in: {demo_src_dir}")
-    
-    for java_file in demo_src_dir.rglob("*.java"):
-        # Skip test files, utilities, and models
-        if any(skip in str(java_file) for skip in ["Test.java", "/model/", "/util/TestUtilities.java", "/infrastructure/", "/runners/"]):
-            continue
-            
-        try:
-            content = java_file.read_text(encoding='utf-8', errors='ignore')
-            
-            # Extract class name and package
-            class_match = re.search(r'public class (\w+)', content)
-            if not class_match:
-                continue
-
-            class_name = class_match.group(1)
-
-            # Extract package
-            package_match = re.search(r'package\s+([\w.]+);', content)
-            package = package_match.group(1) if package_match else "unknown"
-            
-            # Find YAML file references - use a set to avoid duplicates
-            yaml_files_set = set()
-
-            # Look for loadFromClasspath calls
-            for match in re.finditer(r'loadFromClasspath\s*\(\s*["\']([^"\']+\.yaml?)["\']', content):
-                yaml_path = match.group(1)
-                if not yaml_path.endswith('.yaml'):
-                    yaml_path += '.yaml'
-                yaml_files_set.add(yaml_path)
-
-            # Also look for direct YAML file references in strings
-            for match in re.finditer(r'["\']([^"\']*\.yaml)["\']', content):
-                yaml_path = match.group(1)
-                # Only include if it looks like a config file path (not a random string)
-                if '/' in yaml_path or '-config' in yaml_path or '-demo' in yaml_path:
-                    yaml_files_set.add(yaml_path)
-
-            # Convert back to sorted list
-            yaml_files = sorted(list(yaml_files_set))
-            
-            # Check for error handling
-            has_error_handling = "try" in content and "catch" in content
-            
-            # Determine loading pattern
-            if "YamlConfigurationLoader" in content:
-                loading_pattern = "standard_apex_loader"
-            elif "loadFromClasspath" in content:
-                loading_pattern = "custom_loader"
-            else:
-                loading_pattern = "unknown"
-            
-            demo_classes.append({
-                "class_name": class_name,
-                "package": package,
-                "file_path": str(java_file.relative_to(demo_src_dir.parent.parent.parent)),
-                "yaml_files": yaml_files,
-                "loading_pattern": loading_pattern,
-                "error_handling": has_error_handling
-            })
-            
-        except Exception as e:
-            print(f"⚠️  Error analyzing {java_file}: {e}")
-    
-    return demo_classes
+from apex_demo_scan import DEMO_RESOURCES_DIR, DEMO_ROOT, DEMO_SRC_DIR, scan
 
-
-def find_yaml_files(demo_resources_dir):
-    """Find all YAML files in resources."""
-    yaml_files = []
-    
-    if not demo_resources_dir.exists():
-        print(f"X Demo resources directory not found: {demo_resources_dir}")
-        return yaml_files
-    
-    print(f"📄 Scanning for YAML files in: {demo_resources_dir}")
-    
-    for yaml_file in demo_resources_dir.rglob("*.yaml"):
-        try:
-            content = yaml_file.read_text(encoding='utf-8', errors='ignore')
-            # Normalize path separators to forward slashes for consistency
-            relative_path = str(yaml_file.relative_to(demo_resources_dir)).replace('\\', '/')
-            
-            # Basic documentation quality assessment
-            doc_quality = "poor"
-            if content.startswith('#'):
-                doc_quality = "fair"
-                if "metadata:" in content and "description:" in content:
-                    doc_quality = "good"
-                    if "tags:" in content and "version:" in content:
-                        doc_quality = "excellent"
-            
-            yaml_files.append({
-                "path": relative_path,
-                "size": yaml_file.stat().st_size,
-                "documentation_quality": doc_quality,
-                "exists": True
-            })
-            
-        except Exception as e:
-            print(f"⚠️  Error analyzing YAML file {yaml_file}: {e}")
-    
-    return yaml_files
+# Keys of each demo class in the JSON report; the scanner's internal fields
+# (such as classpath_yaml_files, used by simple_mapping.py) are left out
+REPORT_CLASS_KEYS = ("class_name", "package", "file_path", "yaml_files", "loading_pattern", "error_handling")
 
 
 def analyze_patterns(demo_classes):
@@ -186,10 +84,22 @@ def calculate_consistency_score(demo_classes, yaml_files):
     return (total_points / max_points * 100) if max_points > 0 else 0
 
 
-def generate_markdown_report(demo_classes, yaml_files, patterns, consistency_score, output_file):
-    """Generate markdown report."""
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(f"""# APEX Demo YAML File Analysis Report
+def _markdown_report_chunks(demo_classes, yaml_files, existing_yaml_files, patterns, consistency_score):
+    """Yield the markdown report piece by piece."""
+    # Single pass over the classes: collect the ones with YAML files and index
+    # which classes reference each YAML file
+    classes_with_yaml = []
+    yaml_to_classes = defaultdict(list)
+    for demo_class in demo_classes:
+        if demo_class["yaml_files"]:
+            classes_with_yaml.append(demo_class)
+            for yaml_file in demo_class["yaml_files"]:
+                yaml_to_classes[yaml_file].append(demo_class["class_name"])
+
+    referenced_yaml_files = yaml_to_classes.keys()
+    missing_yaml_files = referenced_yaml_files - existing_yaml_files
+
+    yield f"""# APEX Demo YAML File Analysis Report
 
 **Generated:** {datetime.now().isoformat()}
 **Consistency Score:** {consistency_score:.1f}%
@@ -203,54 +113,45 @@ def generate_markdown_report(demo_classes, yaml_files, patterns, consistency_sco
 
 ## 🎯 Pattern Analysis
 
-""")
-        
-        for pattern, count in patterns.items():
-            f.write(f"- **{pattern.replace('_', ' ').title()}:** {count}\n")
-        
-        f.write(f"""
+"""
+    
+    for pattern, count in patterns.items():
+        yield f"- **{pattern.replace('_', ' ').title()}:** {count}\n"
+    
+    yield f"""
 ## 📁 Demo Class to YAML File Mapping
 
 | Class Name | Package | YAML Files | Error Handling |
 |------------|---------|------------|----------------|
-""")
-
-        # Sort all classes by name for consistent output
-        for demo_class in sorted(demo_classes, key=lambda x: x["class_name"]):
-            package_short = demo_class.get('package', 'unknown').split('.')[-1] if demo_class.get('package') else 'unknown'
-            yaml_files_str = "; ".join(demo_class["yaml_files"]) if demo_class["yaml_files"] else "X No YAML files"
-            error_handling = "✅" if demo_class["error_handling"] else "X"
+"""
 
-            # Truncate long YAML file lists for readability
-            if len(yaml_files_str) > 100:
-                yaml_files_str = yaml_files_str[:97] + "..."
+    # Classes arrive sorted by name for consistent output
+    for demo_class in demo_classes:
+        yaml_files_str = "; ".join(demo_class["yaml_files"]) if demo_class["yaml_files"] else "X No YAML files"
+        error_handling = "✅" if demo_class["error_handling"] else "X"
 
-            f.write(f"| {demo_class['class_name']} | {package_short} | {yaml_files_str} | {error_handling} |\n")
+        # Truncate long YAML file lists for readability
+        if len(yaml_files_str) > 100:
+            yaml_files_str = yaml_files_str[:97] + "..."
 
-        # Add a focused section for classes with YAML files
-        classes_with_yaml = [cls for cls in demo_classes if cls["yaml_files"]]
+        # Every scanned class has a package ("unknown" when none was declared)
+        package_short = demo_class['package'].rsplit('.', 1)[-1]
+        yield f"| {demo_class['class_name']} | {package_short} | {yaml_files_str} | {error_handling} |\n"
 
-        f.write(f"""
+    # Add a focused section for classes with YAML files
+    yield f"""
 
 ## 🎯 Classes with YAML Files ({len(classes_with_yaml)} classes)
 
 | Class Name | YAML Files Used |
 |------------|-----------------|
-""")
-
-        for demo_class in sorted(classes_with_yaml, key=lambda x: x["class_name"]):
-            yaml_files_str = "; ".join(demo_class["yaml_files"])
-            f.write(f"| {demo_class['class_name']} | {yaml_files_str} |\n")
-        
-        # Check for missing YAML files
-        referenced_yaml_files = set()
-        for demo_class in demo_classes:
-            referenced_yaml_files.update(demo_class["yaml_files"])
-
-        existing_yaml_files = {yaml_file["path"] for yaml_file in yaml_files}
-        missing_yaml_files = referenced_yaml_files - existing_yaml_files
+"""
 
-        f.write(f"""
+    for demo_class in classes_with_yaml:
+        yaml_files_str = "; ".join(demo_class["yaml_files"])
+        yield f"| {demo_class['class_name']} | {yaml_files_str} |\n"
+    
+    yield f"""
 ## 📄 YAML File Analysis
 
 ### Referenced vs Existing Files
@@ -259,27 +160,26 @@ def generate_markdown_report(demo_classes, yaml_files, patterns, consistency_sco
 - **Total YAML files found in resources:** {len(existing_yaml_files)}
 - **Missing YAML files:** {len(missing_yaml_files)}
 
-""")
+"""
 
-        if missing_yaml_files:
-            f.write("### X Missing YAML Files\n\n")
-            for missing_file in sorted(missing_yaml_files):
-                # Find which classes reference this missing file
-                referencing_classes = [cls["class_name"] for cls in demo_classes if missing_file in cls["yaml_files"]]
-                f.write(f"- `{missing_file}` (referenced by: {', '.join(referencing_classes)})\n")
-            f.write("\n")
+    if missing_yaml_files:
+        yield "### X Missing YAML Files\n\n"
+        for missing_file in sorted(missing_yaml_files):
+            referencing_classes = yaml_to_classes[missing_file]
+            yield f"- `{missing_file}` (referenced by: {', '.join(referencing_classes)})\n"
+        yield "\n"
 
-        f.write(f"""
+    yield f"""
 ### 📋 Existing YAML Files
 
 | File Path | Documentation Quality | Size (bytes) |
 |-----------|----------------------|--------------|
-""")
+"""
 
-        for yaml_file in sorted(yaml_files, key=lambda x: x["path"]):
-            f.write(f"| {yaml_file['path']} | {yaml_file['documentation_quality']} | {yaml_file['size']} |\n")
-        
-        f.write(f"""
+    for yaml_file in yaml_files:
+        yield f"| {yaml_file['path']} | {yaml_file['documentation_quality']} | {yaml_file['size']} |\n"
+    
+    yield f"""
 ## ✅ Conclusion
 
 The APEX demo module shows {'excellent' if consistency_score >= 90 else 'good' if consistency_score >= 70 else 'fair'} consistency in YAML file usage with a score of {consistency_score:.1f}%.
@@ -293,7 +193,25 @@ The APEX demo module shows {'excellent' if consistency_score >= 90 else 'good' i
 - **Multi-file Configurations:** {patterns.get('multiple_yaml_files', 0)} classes
 
 This analysis demonstrates the structure and patterns in the APEX demo module.
-""")
+"""
+
+
+def generate_markdown_report(demo_classes, yaml_files, existing_yaml_files, patterns, consistency_score, output_file):
+    """Generate markdown report."""
+    # Stream the report so table rows are never all held in memory at once
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.writelines(_markdown_report_chunks(demo_classes, yaml_files, existing_yaml_files, patterns, consistency_score))
+
+
+def write_json_report(report_data, json_file):
+    """Write the JSON report, using orjson when it is available."""
+    if orjson is not None:
+        with open(json_file, 'wb') as f:
+            f.write(orjson.dumps(report_data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+
+    with open(json_file, 'w', encoding='utf-8') as f:
+        json.dump(report_data, f, indent=2, default=str)
 
 
 def main():
@@ -302,22 +220,19 @@ def main():
     print("===========================================")
     
     # Set up paths
-    apex_root = Path(".")
-    demo_root = apex_root / "apex-demo"
-    demo_src = demo_root / "src" / "main" / "java" / "dev" / "mars" / "apex" / "demo"
-    demo_resources = demo_root / "src" / "main" / "resources"
+    demo_root = DEMO_ROOT
+    demo_src = DEMO_SRC_DIR
+    demo_resources = DEMO_RESOURCES_DIR
     
     # Check if apex-demo exists
     if not demo_root.exists():
         print(f"X Error: apex-demo directory not found at {demo_root}")
         return 1
     
-    # Analyze demo classes
-    demo_classes = find_demo_classes(demo_src)
+    # Analyze demo classes and YAML files
+    demo_classes, yaml_files = scan(demo_src, demo_resources)
+    existing_yaml_files = {yaml_file["path"] for yaml_file in yaml_files}
     print(f"✅ Found {len(demo_classes)} demo classes")
-    
-    # Analyze YAML files
-    yaml_files = find_yaml_files(demo_resources)
     print(f"✅ Found {len(yaml_files)} YAML files")
     
     # Analyze patterns
@@ -331,7 +246,7 @@ def main():
     os.makedirs("reports", exist_ok=True)
     
     print(f"📝 Generating report: {output_file}")
-    generate_markdown_report(demo_classes, yaml_files, patterns, consistency_score, output_file)
+    generate_markdown_report(demo_classes, yaml_files, existing_yaml_files, patterns, consistency_score, output_file)
     
     # Generate JSON report
     json_file = "reports/simple_demo_analysis.json"
@@ -341,12 +256,13 @@ def main():
         "total_yaml_files": len(yaml_files),
         "consistency_score": consistency_score,
         "patterns": patterns,
-        "demo_classes": demo_classes[:10],  # First 10 for JSON
+        "demo_classes": [  # First 10 for JSON
+            {key: demo_class[key] for key in REPORT_CLASS_KEYS} for demo_class in demo_classes[:10]
+        ],
         "yaml_files": yaml_files[:10]       # First 10 for JSON
     }
     
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(report_data, f, indent=2, default=str)
+    write_json_report(report_data, json_file)
     
     print(f"📊 JSON report: {json_file}")
     
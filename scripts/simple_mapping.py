@@ -6,8 +6,10 @@ Simple Class to YAML Mapping
 Just show the mapping without complex analysis.
 """
 
-import re
-from pathlib import Path
+import os
+import sys
+
+from apex_demo_scan import DEMO_RESOURCES_DIR, DEMO_ROOT, DEMO_SRC_DIR, scan, walk_files
 
 
 def main():
@@ -16,73 +18,49 @@ def main():
     print("=" * 80)
     
     # Set up paths
-    apex_root = Path(".")
-    demo_root = apex_root / "apex-demo"
-    demo_src = demo_root / "src" / "main" / "java" / "dev" / "mars" / "apex" / "demo"
-    demo_resources = demo_root / "src" / "main" / "resources"
+    demo_root = DEMO_ROOT
+    demo_src = DEMO_SRC_DIR
+    demo_resources = DEMO_RESOURCES_DIR
     
     if not demo_root.exists():
         print(f"X Error: apex-demo directory not found")
         return 1
     
-    # Find demo classes and their YAML files
-    mappings = []
+    # Find demo classes and their YAML files (shared with simple_demo_analyzer.py)
+    demo_classes, _ = scan(demo_src, quiet=True)
     
-    for java_file in demo_src.rglob("*.java"):
-        # Skip test files, utilities, and models
-        if any(skip in str(java_file) for skip in ["Test.java", "/model/", "/util/TestUtilities.java", "/infrastructure/", "/runners/"]):
-            continue
-            
-        try:
-            content = java_file.read_text(encoding='utf-8', errors='ignore')
-            
-            # Extract class name
-            class_match = re.search(r'public class (\w+)', content)
-            if not class_match:
-                continue
-                
-            class_name = class_match.group(1)
-            
-            # Find YAML file references
-            yaml_files = set()
-            for match in re.finditer(r'loadFromClasspath\s*\(\s*["\']([^"\']+\.yaml?)["\']', content):
-                yaml_path = match.group(1)
-                if not yaml_path.endswith('.yaml'):
-                    yaml_path += '.yaml'
-                yaml_files.add(yaml_path)
-            
-            # Only include classes that have YAML files
-            if yaml_files:
-                yaml_list = sorted(list(yaml_files))
-                mappings.append((class_name, yaml_list))
-                
-        except Exception:
-            continue
+    # Only include classes that load YAML files from the classpath
+    mappings = [
+        (demo_class["class_name"], demo_class["classpath_yaml_files"])
+        for demo_class in demo_classes
+        if demo_class["classpath_yaml_files"]
+    ]
     
     # Sort by class name
     mappings.sort()
     
     print(f"Found {len(mappings)} demo classes with YAML files:\n")
     
-    # Print the mapping
+    # One walk of the resources tree answers every existence check below; the
+    # files only need listing, not analyzing
+    prefix_length = len(os.path.join(str(demo_resources), ''))
+    existing = {str(yaml_file)[prefix_length:].replace('\\', '/') for yaml_file in walk_files(demo_resources, ".yaml")}
+    
+    # Build the mapping in memory and write it in one go
+    out = []
+    add = out.append
     for class_name, yaml_files in mappings:
-        print(f"**{class_name}**")
+        add(f"**{class_name}**\n")
         for yaml_file in yaml_files:
             # Check if file exists
-            full_path = demo_resources / yaml_file
-            exists = "✅" if full_path.exists() else "X"
-            print(f"  {exists} {yaml_file}")
-        print()
+            exists = "✅" if yaml_file in existing else "X"
+            add(f"  {exists} {yaml_file}\n")
+        add("\n")
+    sys.stdout.write("".join(out))
     
     # Summary
     total_yaml_refs = sum(len(yaml_files) for _, yaml_files in mappings)
-    existing_count = 0
-    
-    for _, yaml_files in mappings:
-        for yaml_file in yaml_files:
-            full_path = demo_resources / yaml_file
-            if full_path.exists():
-                existing_count += 1
+    existing_count = sum(yaml_file in existing for _, yaml_files in mappings for yaml_file in yaml_files)
     
     print(f"📊 Summary:")
     print(f"  Demo classes with YAML: {len(mappings)}")